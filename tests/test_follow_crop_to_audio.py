@@ -1,8 +1,11 @@
 import json
+import sys
 import tempfile
+import threading
 import unittest
 from io import StringIO
 from pathlib import Path
+from unittest import mock
 
 from rich.console import Console
 from rich.progress import TimeRemainingColumn
@@ -18,6 +21,7 @@ from video.follow_crop_to_audio import (
     build_filter_complex,
     build_progress_columns,
     calculate_timing,
+    ensure_tool_available,
     load_identity_path,
     options_from_args,
     parse_loudnorm_output,
@@ -25,6 +29,7 @@ from video.follow_crop_to_audio import (
     parse_volumedetect_output,
     parse_resolution,
     render_summary,
+    run_ffmpeg,
 )
 
 
@@ -457,6 +462,89 @@ class FollowCropToAudioTests(unittest.TestCase):
         self.assertLess(output.index("Video"), output.index("Audio settings"))
         self.assertLess(output.index("Audio analysis"), output.index("Output"))
 
+    def test_ensure_tool_available_returns_resolved_path(self) -> None:
+        self.assertEqual(ensure_tool_available(sys.executable), sys.executable)
+
+        with self.assertRaisesRegex(FileNotFoundError, "was not found in PATH"):
+            ensure_tool_available("definitely-missing-tool-for-tests")
+
+    def run_ffmpeg_expecting_failure(self, script: str, timeout: float = 30.0) -> str:
+        errors: list[BaseException] = []
+
+        def target() -> None:
+            try:
+                run_ffmpeg([sys.executable, "-c", script], final_duration=1.0)
+            except BaseException as exc:
+                errors.append(exc)
+
+        original_console = follow_crop.console
+        follow_crop.console = Console(file=StringIO(), force_terminal=False)
+        try:
+            worker = threading.Thread(target=target, daemon=True)
+            worker.start()
+            worker.join(timeout)
+        finally:
+            follow_crop.console = original_console
+
+        if worker.is_alive():
+            self.fail(f"run_ffmpeg did not finish within {timeout}s (pipe deadlock?)")
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], RuntimeError)
+        return str(errors[0])
+
+    def test_run_ffmpeg_drains_stderr_while_reading_progress(self) -> None:
+        script = (
+            "import sys\n"
+            "sys.stderr.write('noise\\n' * 50000)\n"
+            "sys.stderr.write('final error\\n')\n"
+            "sys.stderr.flush()\n"
+            "print('out_time_us=500000', flush=True)\n"
+            "sys.exit(1)\n"
+        )
+
+        message = self.run_ffmpeg_expecting_failure(script)
+
+        self.assertTrue(message.endswith("final error"))
+        self.assertLessEqual(len(message.splitlines()), follow_crop.FFMPEG_STDERR_TAIL_LINES)
+
+    def test_run_ffmpeg_survives_undecodable_stderr(self) -> None:
+        script = (
+            "import sys\n"
+            "sys.stderr.buffer.write(b'bad \\xff\\xfe tag\\n' + b'noise\\n' * 50000)\n"
+            "sys.stderr.buffer.write(b'final error\\n')\n"
+            "sys.stderr.flush()\n"
+            "print('out_time_us=500000', flush=True)\n"
+            "sys.exit(1)\n"
+        )
+
+        message = self.run_ffmpeg_expecting_failure(script)
+
+        self.assertTrue(message.endswith("final error"))
+
+    def test_run_ffmpeg_terminates_child_when_interrupted(self) -> None:
+        script = "import time\nprint('out_time_us=500000', flush=True)\ntime.sleep(60)\n"
+        processes = []
+        original_popen = follow_crop.subprocess.Popen
+
+        def tracking_popen(*args, **kwargs):
+            process = original_popen(*args, **kwargs)
+            processes.append(process)
+            return process
+
+        original_console = follow_crop.console
+        follow_crop.console = Console(file=StringIO(), force_terminal=False)
+        try:
+            with mock.patch.object(follow_crop.subprocess, "Popen", side_effect=tracking_popen), mock.patch.object(
+                follow_crop, "_progress_value_to_ms", side_effect=KeyboardInterrupt
+            ):
+                with self.assertRaises(KeyboardInterrupt):
+                    run_ffmpeg([sys.executable, "-c", script], final_duration=1.0)
+        finally:
+            follow_crop.console = original_console
+
+        self.assertEqual(len(processes), 1)
+        self.assertIsNotNone(processes[0].poll())
+
     def test_progress_columns_include_eta(self) -> None:
         columns = build_progress_columns()
 
@@ -0,0 +1,136 @@
+import json
+import os
+import stat
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from video.rename_video_by_tags import ExifToolSession
+
+
+STUB_EXIFTOOL = textwrap.dedent(
+    """\
+    #!{python}
+    import json
+    import os
+    import sys
+    import time
+
+    LOG = {log!r}
+
+
+    def log(entry):
+        with open(LOG, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(entry) + "\\n")
+
+
+    def reply(path):
+        if path.endswith("slow.mp4"):
+            time.sleep(5)
+        if not os.path.exists(path):
+            sys.stderr.write("Error: File not found - " + path + "\\n")
+            return
+        sys.stdout.write(json.dumps([{{"SourceFile": path, "Model": "Stub"}}]) + "\\n")
+
+
+    argv = [os.fsdecode(arg) for arg in sys.argv[1:]]
+    if argv[:2] != ["-stay_open", "True"]:
+        log({{"mode": "argv", "args": argv}})
+        reply(argv[-1])
+        sys.exit(0)
+
+    log({{"mode": "stay_open"}})
+    args = []
+    for raw in sys.stdin.buffer:
+        arg = os.fsdecode(raw.rstrip(b"\\n"))
+        if arg == "-execute":
+            log({{"mode": "execute", "args": args}})
+            reply(args[-1])
+            sys.stdout.write("{{ready}}\\n")
+            sys.stdout.flush()
+            sys.stderr.write("{{ready}}\\n")
+            sys.stderr.flush()
+            args = []
+        elif arg == "False" and args[-1:] == ["-stay_open"]:
+            break
+        else:
+            args.append(arg)
+    """
+)
+
+
+class ExifToolSessionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmp = Path(tmpdir.name)
+        self.log_path = self.tmp / "calls.jsonl"
+        bin_dir = self.tmp / "bin"
+        bin_dir.mkdir()
+        stub = bin_dir / "exiftool"
+        stub.write_text(STUB_EXIFTOOL.format(python=sys.executable, log=str(self.log_path)), encoding="utf-8")
+        stub.chmod(stub.stat().st_mode | stat.S_IXUSR)
+        path_patch = mock.patch.dict(os.environ, {"PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}"})
+        path_patch.start()
+        self.addCleanup(path_patch.stop)
+
+    def calls(self) -> list[dict]:
+        if not self.log_path.exists():
+            return []
+        return [json.loads(line) for line in self.log_path.read_text(encoding="utf-8").splitlines()]
+
+    def test_query_reuses_one_process(self) -> None:
+        first = self.tmp / "a.mp4"
+        second = self.tmp / "b.mp4"
+        first.touch()
+        second.touch()
+
+        with ExifToolSession() as session:
+            self.assertEqual(session.query(first), ({"SourceFile": str(first), "Model": "Stub"}, None))
+            self.assertEqual(session.query(second), ({"SourceFile": str(second), "Model": "Stub"}, None))
+
+        modes = [call["mode"] for call in self.calls()]
+        self.assertEqual(modes, ["stay_open", "execute", "execute"])
+
+    def test_query_reports_exiftool_errors(self) -> None:
+        missing = self.tmp / "missing.mp4"
+
+        with ExifToolSession() as session:
+            meta, error = session.query(missing)
+
+        self.assertIsNone(meta)
+        self.assertEqual(error, f"Error: File not found - {missing}")
+
+    def test_query_passes_newline_path_as_single_argument(self) -> None:
+        target = self.tmp / "a.mp4"
+        target.touch()
+        tricky = Path(f"{self.tmp}/x\n-all=\n{target}")
+
+        with ExifToolSession() as session:
+            meta, error = session.query(tricky)
+
+        self.assertIsNone(meta)
+        self.assertIn("File not found", error)
+        calls = self.calls()
+        self.assertEqual(calls, [{"mode": "argv", "args": ["-json", "--", str(tricky)]}])
+
+    def test_query_times_out_and_restarts_process(self) -> None:
+        slow = self.tmp / "slow.mp4"
+        fast = self.tmp / "a.mp4"
+        slow.touch()
+        fast.touch()
+
+        with ExifToolSession() as session:
+            self.assertEqual(session.query(slow, timeout_s=1), (None, "exiftool timeout after 1s"))
+            meta, error = session.query(fast)
+
+        self.assertIsNone(error)
+        self.assertEqual(meta["SourceFile"], str(fast))
+        self.assertEqual([call["mode"] for call in self.calls()].count("stay_open"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ import argparse
 import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -79,6 +80,12 @@ def main():
         default=Path('files_non4k.txt'),
         help='Output file for non-4K file list (default: files_non4k.txt)'
     )
+    parser.add_argument(
+        '--threads',
+        type=int,
+        default=None,
+        help='Number of parallel ffprobe processes (default: min(32, CPU count + 4))'
+    )
 
     args = parser.parse_args()
 
@@ -90,6 +97,10 @@ def main():
         print(f"Error: Not a directory: {args.directory}", file=sys.stderr)
         sys.exit(1)
 
+    if args.threads is not None and args.threads < 1:
+        print("Error: --threads must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
     # Find all MP4 files
     print(f"Scanning {args.directory} for MP4 files...")
     mp4_files = sorted(args.directory.rglob("*.mp4"))
@@ -104,26 +115,27 @@ def main():
     files_4k = []
     files_non4k = []
 
-    for idx, mp4 in enumerate(mp4_files, 1):
-        info = get_video_info(mp4)
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        results = executor.map(get_video_info, mp4_files)
 
-        if info is None:
-            print(f"[{idx}/{len(mp4_files)}] SKIP  {mp4.name}")
-            continue
+        for idx, (mp4, info) in enumerate(zip(mp4_files, results), 1):
+            if info is None:
+                print(f"[{idx}/{len(mp4_files)}] SKIP  {mp4.name}")
+                continue
 
-        resolution = f"{info['width']}x{info['height']}"
-        is4k = is_4k(info['width'], info['height'])
-        marker = "4K   " if is4k else "NON4K"
+            resolution = f"{info['width']}x{info['height']}"
+            is4k = is_4k(info['width'], info['height'])
+            marker = "4K   " if is4k else "NON4K"
 
-        print(f"[{idx}/{len(mp4_files)}] {marker} {mp4.name}")
-        print(f"           Resolution: {resolution}, Bitrate: {info['bitrate']:.1f}Mbps, Codec: {info['codec']}")
+            print(f"[{idx}/{len(mp4_files)}] {marker} {mp4.name}")
+            print(f"           Resolution: {resolution}, Bitrate: {info['bitrate']:.1f}Mbps, Codec: {info['codec']}")
 
-        file_entry = f"{mp4}\t{resolution}\t{info['bitrate']:.1f}Mbps\t{info['codec']}\n"
+            file_entry = f"{mp4}\t{resolution}\t{info['bitrate']:.1f}Mbps\t{info['codec']}\n"
 
-        if is4k:
-            files_4k.append(file_entry)
-        else:
-            files_non4k.append(file_entry)
+            if is4k:
+                files_4k.append(file_entry)
+            else:
+                files_non4k.append(file_entry)
 
     # Write results
     print()
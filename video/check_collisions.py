@@ -3,6 +3,7 @@
 Check for files with same basename but different extensions (.mp4, .flv)
 """
 
+import os
 from pathlib import Path
 from collections import defaultdict
 import sys
@@ -15,11 +16,20 @@ def find_duplicate_stems(directory, extensions=['mp4', 'flv']):
     # Structure: {directory: {stem: [file1, file2, ...]}}
     dir_files = defaultdict(lambda: defaultdict(list))
 
-    for ext in extensions:
-        for file in Path(directory).rglob(f"*.{ext}"):
-            parent = file.parent
-            stem = file.stem
-            dir_files[parent][stem].append(file)
+    suffixes = tuple(f".{ext}" for ext in extensions)
+    stack = [Path(directory)]
+    while stack:
+        parent = stack.pop()
+        try:
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(parent / entry.name)
+                    elif entry.name.endswith(suffixes):
+                        file = parent / entry.name
+                        dir_files[parent][file.stem].append(file)
+        except OSError:
+            continue
 
     # Find collisions (same stem, multiple extensions in same directory)
     collisions = []
@@ -9,7 +9,9 @@ import re
 import shutil
 import subprocess
 import sys
-from dataclasses import dataclass
+import threading
+from collections import deque
+from dataclasses import dataclass, replace
 from pathlib import Path
 from urllib.parse import unquote, urlparse
 
@@ -45,6 +47,9 @@ OUTPUT_SUFFIX = "follow_audio"
 OVERWRITE_OUTPUT = False
 FFMPEG_BIN = "ffmpeg"
 FFPROBE_BIN = "ffprobe"
+FFMPEG_STDERR_TAIL_LINES = 200
+FFMPEG_TERMINATE_TIMEOUT_SECONDS = 5.0
+PROGRESS_TIMESTAMP_RE = re.compile(r"(\d+):(\d+):(\d+(?:\.\d+)?)")
 
 console = Console()
 
@@ -474,20 +479,28 @@ def run_ffmpeg(command: list[str], final_duration: float) -> None:
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
+            encoding="utf-8",
+            errors="replace",
             bufsize=1,
         )
-        if process.stdout is not None:
-            for line in process.stdout:
-                key, separator, value = line.strip().partition("=")
-                if separator:
-                    current_ms = _progress_value_to_ms(key, value)
-                    if current_ms is not None:
-                        progress.update(task, completed=min(current_ms, total_ms))
-
-        stderr = process.stderr.read() if process.stderr is not None else ""
-        return_code = process.wait()
+        stderr_tail: deque[str] = deque(maxlen=FFMPEG_STDERR_TAIL_LINES)
+        stderr_reader = threading.Thread(target=stderr_tail.extend, args=(process.stderr,), daemon=True)
+        stderr_reader.start()
+        try:
+            if process.stdout is not None:
+                for line in process.stdout:
+                    key, separator, value = line.strip().partition("=")
+                    if separator:
+                        current_ms = _progress_value_to_ms(key, value)
+                        if current_ms is not None:
+                            progress.update(task, completed=min(current_ms, total_ms))
+
+            return_code = process.wait()
+        finally:
+            _stop_process(process)
+        stderr_reader.join()
         if return_code != 0:
-            raise RuntimeError(stderr.strip() or f"ffmpeg failed with exit code {return_code}")
+            raise RuntimeError("".join(stderr_tail).strip() or f"ffmpeg failed with exit code {return_code}")
         progress.update(task, completed=total_ms)
 
 
@@ -627,8 +640,11 @@ def main(argv: list[str] | None = None) -> int:
 
     try:
         options = options_from_args(args)
-        ensure_tool_available(options.ffmpeg_bin)
-        ensure_tool_available(options.ffprobe_bin)
+        options = replace(
+            options,
+            ffmpeg_bin=ensure_tool_available(options.ffmpeg_bin),
+            ffprobe_bin=ensure_tool_available(options.ffprobe_bin),
+        )
         identity_json = args.identity_json.expanduser()
         audio_path = args.audio_file.expanduser()
         target_width, target_height = parse_resolution(args.resolution)
@@ -679,9 +695,11 @@ def main(argv: list[str] | None = None) -> int:
         return 1
 
 
-def ensure_tool_available(name: str) -> None:
-    if shutil.which(name) is None:
+def ensure_tool_available(name: str) -> str:
+    path = shutil.which(name)
+    if path is None:
         raise FileNotFoundError(f"{name} was not found in PATH")
+    return path
 
 
 def validate_inputs(
@@ -791,6 +809,17 @@ def _build_center_expression(points: tuple[IdentityPoint, ...], axis: str) -> st
     return expression
 
 
+def _stop_process(process: subprocess.Popen) -> None:
+    if process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout=FFMPEG_TERMINATE_TIMEOUT_SECONDS)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
 def _progress_value_to_ms(key: str, value: str) -> int | None:
     if key in ("out_time_us", "out_time_ms"):
         try:
@@ -803,7 +832,7 @@ def _progress_value_to_ms(key: str, value: str) -> int | None:
 
 
 def _timestamp_to_ms(value: str) -> int | None:
-    match = re.fullmatch(r"(\d+):(\d+):(\d+(?:\.\d+)?)", value)
+    match = PROGRESS_TIMESTAMP_RE.fullmatch(value)
     if not match:
         return None
     hours = int(match.group(1))
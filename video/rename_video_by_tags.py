@@ -9,6 +9,7 @@ import os
 import re
 import subprocess
 import sys
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -79,37 +80,121 @@ def load_all_presets() -> Tuple[Dict[str, Any], Optional[str]]:
         return {}, f"Błąd odczytu {config_path}: {e!r}"
 
 
-def run_exiftool_json(path: Path, timeout_s: int = 30) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
-    cmd = ["exiftool", "-json", str(path)]
-    try:
-        p = subprocess.run(
-            cmd,
+class ExifToolSession:
+    def __init__(self) -> None:
+        self._proc: Optional[subprocess.Popen] = None
+
+    def _start(self) -> subprocess.Popen:
+        self._proc = subprocess.Popen(
+            ["exiftool", "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            timeout=timeout_s,
-            check=False,
         )
-    except FileNotFoundError:
-        return None, "exiftool not found in PATH"
-    except subprocess.TimeoutExpired:
-        return None, f"exiftool timeout after {timeout_s}s"
-    except Exception as e:
-        return None, f"exiftool exec error: {e!r}"
-
-    if p.returncode != 0:
-        err = (p.stderr or "").strip()
-        out = (p.stdout or "").strip()
-        msg = err if err else (out[:200] if out else f"exiftool exit code {p.returncode}")
-        return None, msg
+        return self._proc
+
+    @staticmethod
+    def _read_until_ready(stream) -> str:
+        lines: List[bytes] = []
+        while True:
+            line = stream.readline()
+            if not line:
+                raise EOFError
+            if line.rstrip(b"\r\n") == b"{ready}":
+                return b"".join(lines).decode("utf-8", errors="replace")
+            lines.append(line)
+
+    @staticmethod
+    def _parse_reply(out: str, err: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        err = err.strip()
+        if not out.strip():
+            return None, err or "exiftool returned no output"
 
-    try:
-        data = json.loads(p.stdout)
+        try:
+            data = json.loads(out)
+        except json.JSONDecodeError as e:
+            return None, f"json decode error: {e}"
         if not isinstance(data, list) or not data or not isinstance(data[0], dict):
             return None, "unexpected exiftool JSON structure"
+        if "Error" in data[0]:
+            return None, err or str(data[0]["Error"])
         return data[0], None
-    except json.JSONDecodeError as e:
-        return None, f"json decode error: {e}"
+
+    @classmethod
+    def _query_once(cls, path: Path, timeout_s: int) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        try:
+            p = subprocess.run(
+                ["exiftool", "-json", "--", str(path)],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                timeout=timeout_s,
+                check=False,
+            )
+        except FileNotFoundError:
+            return None, "exiftool not found in PATH"
+        except subprocess.TimeoutExpired:
+            return None, f"exiftool timeout after {timeout_s}s"
+        except Exception as e:
+            return None, f"exiftool exec error: {e!r}"
+        return cls._parse_reply(
+            p.stdout.decode("utf-8", errors="replace"),
+            p.stderr.decode("utf-8", errors="replace"),
+        )
+
+    def query(self, path: Path, timeout_s: int = 30) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        raw_path = os.fsencode(path)
+        if b"\n" in raw_path or b"\r" in raw_path:
+            return self._query_once(path, timeout_s)
+
+        try:
+            proc = self._proc if self._proc is not None and self._proc.poll() is None else self._start()
+            proc.stdin.write(b"-json\n-echo4\n{ready}\n" + raw_path + b"\n-execute\n")
+            proc.stdin.flush()
+        except FileNotFoundError:
+            return None, "exiftool not found in PATH"
+        except Exception as e:
+            self.close()
+            return None, f"exiftool exec error: {e!r}"
+
+        timed_out = threading.Event()
+
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout_s, kill_on_timeout)
+        timer.start()
+        try:
+            out = self._read_until_ready(proc.stdout)
+            err = self._read_until_ready(proc.stderr)
+        except EOFError:
+            self.close()
+            if timed_out.is_set():
+                return None, f"exiftool timeout after {timeout_s}s"
+            return None, "exiftool exited unexpectedly"
+        finally:
+            timer.cancel()
+
+        return self._parse_reply(out, err)
+
+    def close(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if proc.poll() is None:
+                proc.stdin.write(b"-stay_open\nFalse\n")
+                proc.stdin.flush()
+                proc.wait(timeout=5)
+        except Exception:
+            proc.kill()
+            proc.wait()
+
+    def __enter__(self) -> "ExifToolSession":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
 
 def evaluate_tags_for_preset(meta: Dict[str, Any], name: str, preset_config: Dict[str, Any]) -> Decision:
@@ -289,7 +374,7 @@ def build_epilog(all_presets: Optional[Dict[str, Any]] = None) -> str:
     
     return f"""\nOpis działania:
 - Skrypt skanuje rekursywnie katalog bieżący (.) i wszystkie podkatalogi w poszukiwaniu plików *.mp4 (case-insensitive).
-- Dla każdego pliku uruchamia: exiftool -json <plik> i dopasowuje pierwszy pasujący preset z YAML.
+- Uruchamia jeden proces exiftool -stay_open, odczytuje z niego metadane (-json) każdego pliku i dopasowuje pierwszy pasujący preset z YAML.
 
 Logika presetów (kaskada):
 - Skrypt sprawdza presety w kolejności ich wystąpienia w pliku YAML.
@@ -297,6 +382,7 @@ Logika presetów (kaskada):
 {preset_info}Zmiana nazwy:
 - Dokleja <delim><suffix> tuż przed prawdziwym rozszerzeniem, zachowując oryginalny case rozszerzenia.
 - Nigdy nie nadpisuje istniejących plików: konflikt jest raportowany i plik jest pomijany.
+- Pliki, które mają już znany suffix, są pomijane bez odczytu metadanych i liczone jako 'już z suffixem' (chyba że użyto --force lub --normalize).
 - --dry-run: nie wykonuje zmian, tylko wypisuje co BY zrobił.
 """
 
@@ -365,13 +451,22 @@ def main(argv: List[str]) -> int:
         console=console,
     )
 
-    with progress:
+    with progress, ExifToolSession() as exiftool:
         task = progress.add_task("Analizowanie plików", total=len(files))
 
         for path in files:
             stats["scanned"] += 1
 
-            meta, exif_err = run_exiftool_json(path, timeout_s=args.timeout)
+            old_suffix_info = get_current_suffix(path, all_presets)
+            if old_suffix_info and not args.force and not args.normalize:
+                stats["skipped_already_suffixed"] += 1
+                if args.debug:
+                    old_delim, old_suf = old_suffix_info
+                    console.print(f"\n[bold]{path}[/bold] [yellow]SKIP[/yellow] plik ma już suffix {old_delim}{old_suf} (użyj --force aby zmienić)")
+                progress.advance(task)
+                continue
+
+            meta, exif_err = exiftool.query(path, timeout_s=args.timeout)
             if exif_err is not None or meta is None:
                 stats["errors_exiftool"] += 1
                 if args.debug:
@@ -418,8 +513,6 @@ def main(argv: List[str]) -> int:
                 delimiter = preset_cfg.get("delimiter", "_")
 
             # Inteligentne sprawdzenie istniejącego suffixu
-            old_suffix_info = get_current_suffix(path, all_presets)
-            
             if old_suffix_info:
                 old_delim, old_suf = old_suffix_info
                 # Jeśli ma już ten sam suffix i NIE normalizujemy - pomijamy
@@ -428,14 +521,6 @@ def main(argv: List[str]) -> int:
                     progress.advance(task)
                     continue
                 
-                # Jeśli ma INNY znany suffix i NIE ma --force i NIE normalizujemy - pomijamy
-                if not args.force and not args.normalize and (old_suf.lower() != suffix.lower() or old_delim != delimiter):
-                    stats["skipped_already_suffixed"] += 1
-                    if args.debug:
-                        console.print(f"  [yellow]SKIP[/yellow] plik ma już suffix {old_delim}{old_suf} (użyj --force aby zmienić)")
-                    progress.advance(task)
-                    continue
-                
                 # Jeśli jest --force i inny suffix - będziemy go zastępować
 
             # Przekazujemy metadane do normalizacji tylko jeśli opcja jest włączona
@@ -33,6 +33,10 @@ TAG_ALIASES_EXIF = {
     'size_bytes': ['MediaDataSize', 'FileSize']
 }
 
+WHITESPACE_RE = re.compile(r'[\s\t]+')
+FILENAME_DATE_RE = re.compile(r'(\d{8}_\d{6})|(\d{8})')
+DATE_STRIP_TABLE = str.maketrans('', '', ':-')
+
 console = Console()
 status_line = Text("", style="dim blue")
 
@@ -41,9 +45,9 @@ def clean_date(raw_date):
     # Handle formats like "2021-05-15 16:10:27 UTC" or "2021:05:15 16:10:27"
     clean = str(raw_date).replace('UTC', '').replace('Z', '').strip().split('+')[0].split('.')[0]
     # Remove separators but keep a placeholder for the space between date and time
-    clean = clean.replace(':', '').replace('-', '').strip()
+    clean = clean.translate(DATE_STRIP_TABLE).strip()
     # Replace any remaining spaces or tabs with underscores
-    clean = re.sub(r'[\s\t]+', '_', clean)
+    clean = WHITESPACE_RE.sub('_', clean)
     
     # If it's a long string of digits (YYYYMMDDHHMMSS), format it nicely
     if len(clean) >= 14 and clean[:14].isdigit():
@@ -174,6 +178,19 @@ def get_metadata_exif(filename, use_vbc_size=False, date_tag=None):
         }
     except: return None
 
+def iter_video_files(root, recursive):
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(EXTENSIONS) and entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+
 def safe_rename(src, dst):
     if os.path.exists(dst):
         return False, "Destination already exists"
@@ -222,7 +239,7 @@ def rename_file(filename, mode, debug, progress, task_id, root_path, use_vbc_siz
         date_part = meta['date']
         if not date_part:
             # Try to extract YYYYMMDD_HHMMSS or YYYYMMDD from filename
-            match = re.search(r'(\d{8}_\d{6})|(\d{8})', old_name_base)
+            match = FILENAME_DATE_RE.search(old_name_base)
             if match:
                 date_part = match.group(0)
             else:
@@ -301,10 +318,7 @@ def main():
                 console.print("[yellow]Cancelled.[/yellow]")
                 return
 
-        if recursive:
-            files = [str(p) for p in target.rglob("*") if p.is_file() and p.suffix.lower() in EXTENSIONS]
-        else:
-            files = [str(p) for p in target.iterdir() if p.is_file() and p.suffix.lower() in EXTENSIONS]
+        files = list(iter_video_files(str(target), recursive))
 
         if not files:
             console.print("[yellow]No video files found in selected mode.[/yellow]")
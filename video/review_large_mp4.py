@@ -18,11 +18,22 @@ def format_size(size_bytes):
     s = round(size_bytes / p, 2)
     return f"{s} {size_name[i]}"
 
-def get_file_size(path):
-    try:
-        return path.stat().st_size
-    except OSError:
-        return 0
+def iter_mp4_files(root, recursive):
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".mp4") and entry.is_file():
+                        try:
+                            size = entry.stat().st_size
+                        except OSError:
+                            size = 0
+                        yield Path(entry.path), size
+        except OSError:
+            continue
 
 def main():
     parser = argparse.ArgumentParser(description="Find and review top N largest mp4 files.")
@@ -45,11 +56,10 @@ def main():
     ) as progress:
         task = progress.add_task("Searching for mp4 files...".ljust(25), total=None)
         
-        search_glob = "**/*.mp4" if args.recursive else "*.mp4"
-        for path in Path(".").glob(search_glob):
+        for path, size in iter_mp4_files(".", args.recursive):
             mp4_files.append({
                 "path": path,
-                "size": get_file_size(path)
+                "size": size
             })
             progress.update(task, advance=1)
         
@@ -41,6 +41,10 @@ def sort_files(target_dir, dry_run=False):
         return
 
     files.sort()
+
+    if not dry_run:
+        for date_part in sorted({pattern.match(f).group(1) for f in files}):
+            os.makedirs(os.path.join(target_dir, date_part), exist_ok=True)
     
     with Progress(
         SpinnerColumn(),
@@ -64,8 +68,6 @@ def sort_files(target_dir, dry_run=False):
                 if dry_run:
                     console.print(f"[blue]Dry-run:[/blue] {filename} -> {date_part}/")
                 else:
-                    os.makedirs(dest_dir, exist_ok=True)
-                    
                     src_path = os.path.join(target_dir, filename)
                     dest_path = os.path.join(dest_dir, filename)
                     